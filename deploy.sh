@@ -128,7 +128,7 @@ package_and_deploy_lambda() {
     rm lambda-deployment.zip
 
     # Cleanup installed packages
-    cd lambda && rm -rf psycopg2* *.dist-info *.egg-info __pycache__ 2>/dev/null || true && cd ..
+    cd lambda && rm -rf psycopg2* brotli.py _brotli* *.dist-info *.egg-info __pycache__ 2>/dev/null || true && cd ..
     print_success "All Lambda functions deployed"
 }
 
@@ -1,8 +1,7 @@
 import Image from "next/image";
-import Link from "next/link";
 import { notFound } from "next/navigation";
 import { getMangaBySlug, getAllMangaSlugs } from "@/lib/api";
-import { formatTimeAgo } from "@/lib/data";
+import ChapterList from "@/components/ChapterList";
 
 export const dynamic = "force-static";
 export const dynamicParams = true;
@@ -18,7 +17,8 @@ interface MangaPageProps {
 
 export default async function MangaPage({ params }: MangaPageProps) {
   const { slug } = await params;
-  const mangaData = await getMangaBySlug(slug);
+  // Only the newest window of chapters is rendered; older ones load on demand
+  const mangaData = await getMangaBySlug(slug, { order: "desc" });
 
   if (!mangaData) {
     notFound();
@@ -36,13 +36,7 @@ export default async function MangaPage({ params }: MangaPageProps) {
     author: mangaData.author || "Unknown",
     artist: mangaData.artist || "Unknown",
     year: mangaData.year || 0,
-    chapters: mangaData.chapters.map((ch) => ({
-      id: ch.id,
-      number: parseFloat(ch.chapter_number),
-      title: ch.title || `Chapter ${ch.chapter_number}`,
-      pages: ch.page_count,
-      createdAt: new Date(ch.created_at),
-    })),
+    chapterCount: mangaData.chapter_summary.count,
   };
 
   const statusColors = {
@@ -113,7 +107,7 @@ export default async function MangaPage({ params }: MangaPageProps) {
             </div>
             <div>
               <span className="text-[#737373]">Chapters:</span>{" "}
-              <span className="text-[#e5e5e5]">{manga.chapters.length}</span>
+              <span className="text-[#e5e5e5]">{manga.chapterCount}</span>
             </div>
           </div>
 
@@ -124,37 +118,12 @@ export default async function MangaPage({ params }: MangaPageProps) {
       {/* Chapter list */}
       <section>
         <h2 className="text-xl font-bold text-[#e5e5e5] mb-4">Chapters</h2>
-        <div className="bg-[#242424] overflow-hidden">
-          {manga.chapters.length === 0 ? (
-            <div className="p-4 text-[#737373] text-center">
-              No chapters available yet
-            </div>
-          ) : (
-            [...manga.chapters].reverse().map((chapter, index) => (
-              <Link
-                key={chapter.id}
-                href={`/manga/${manga.slug}/chapter/${chapter.number}`}
-                className={`flex items-center justify-between p-4 hover:bg-[#2d2d2d] transition-colors ${
-                  index !== 0 ? "border-t border-[#404040]" : ""
-                }`}
-              >
-                <div>
-                  <span className="font-medium text-[#e5e5e5]">
-                    Chapter {chapter.number}
-                  </span>
-                  {chapter.title !== `Chapter ${chapter.number}` && (
-                    <span className="text-[#a3a3a3] ml-2">
-                      - {chapter.title}
-                    </span>
-                  )}
-                </div>
-                <span className="text-sm text-[#737373]">
-                  {formatTimeAgo(chapter.createdAt)}
-                </span>
-              </Link>
-            ))
-          )}
-        </div>
+        <ChapterList
+          mangaId={manga.id}
+          mangaSlug={manga.slug}
+          initialChapters={mangaData.chapters}
+          nextCursor={mangaData.chapter_window.next_cursor}
+        />
       </section>
     </main>
   );
@@ -0,0 +1,99 @@
+"use client";
+
+import { useState } from "react";
+import Link from "next/link";
+import { getMangaChapters, ApiChapter } from "@/lib/api";
+import { formatTimeAgo } from "@/lib/data";
+
+interface ChapterListProps {
+  mangaId: string;
+  mangaSlug: string;
+  initialChapters: ApiChapter[];
+  nextCursor: string | null;
+}
+
+export default function ChapterList({
+  mangaId,
+  mangaSlug,
+  initialChapters,
+  nextCursor,
+}: ChapterListProps) {
+  const [chapters, setChapters] = useState(initialChapters);
+  const [cursor, setCursor] = useState(nextCursor);
+  const [isLoading, setIsLoading] = useState(false);
+  const [loadError, setLoadError] = useState(false);
+
+  const loadMore = async () => {
+    if (!cursor || isLoading) return;
+    setIsLoading(true);
+    setLoadError(false);
+    try {
+      const page = await getMangaChapters(mangaId, {
+        order: "desc",
+        after: cursor,
+      });
+      setChapters((prev) => [...prev, ...page.chapters]);
+      setCursor(page.window.next_cursor);
+    } catch (error) {
+      console.error("Failed to load chapters:", error);
+      setLoadError(true);
+    } finally {
+      setIsLoading(false);
+    }
+  };
+
+  if (chapters.length === 0) {
+    return (
+      <div className="bg-[#242424] overflow-hidden">
+        <div className="p-4 text-[#737373] text-center">
+          No chapters available yet
+        </div>
+      </div>
+    );
+  }
+
+  return (
+    <div className="bg-[#242424] overflow-hidden">
+      {chapters.map((ch, index) => {
+        const number = parseFloat(ch.chapter_number);
+        return (
+          <Link
+            key={ch.id}
+            href={`/manga/${mangaSlug}/chapter/${number}`}
+            className={`flex items-center justify-between p-4 hover:bg-[#2d2d2d] transition-colors ${
+              index !== 0 ? "border-t border-[#404040]" : ""
+            }`}
+          >
+            <div>
+              <span className="font-medium text-[#e5e5e5]">
+                Chapter {number}
+              </span>
+              {ch.title && ch.title !== `Chapter ${number}` && (
+                <span className="text-[#a3a3a3] ml-2">- {ch.title}</span>
+              )}
+            </div>
+            <span className="text-sm text-[#737373]">
+              {formatTimeAgo(ch.created_at)}
+            </span>
+          </Link>
+        );
+      })}
+      {cursor && (
+        <button
+          type="button"
+          onClick={loadMore}
+          disabled={isLoading}
+          className={`w-full p-4 border-t border-[#404040] hover:bg-[#2d2d2d] hover:text-[#e5e5e5] transition-colors disabled:opacity-50 ${
+            loadError ? "text-red-400" : "text-[#a3a3a3]"
+          }`}
+        >
+          {isLoading
+            ? "Loading..."
+            : loadError
+              ? "Failed to load chapters - retry"
+              : "Load more chapters"}
+        </button>
+      )}
+    </div>
+  );
+}
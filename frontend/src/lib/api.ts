@@ -30,11 +30,20 @@ interface MangaResponse {
 }
 
 interface SingleMangaResponse {
-  manga: ApiManga & { chapters: ApiChapter[] };
+  manga: ApiManga & {
+    chapters: CompactChapter[];
+    chapter_summary: ApiChapterSummary;
+    chapter_window: ApiChapterWindow;
+  };
+}
+
+interface ChaptersResponse {
+  chapters: CompactChapter[];
+  chapter_window: ApiChapterWindow;
 }
 
 interface ChapterResponse {
-  chapter: ApiChapterDetail;
+  chapter: CompactChapterDetail;
 }
 
 interface LatestMangaResponse {
@@ -70,6 +79,33 @@ export interface ApiChapter {
   created_at: string;
 }
 
+export interface ApiChapterSummary {
+  count: number;
+  first: string | null;
+  latest: string | null;
+}
+
+export interface ApiChapterWindow {
+  order: "asc" | "desc";
+  limit: number;
+  prev_cursor: string | null;
+  next_cursor: string | null;
+}
+
+export type ApiMangaDetail = ApiManga & {
+  chapters: ApiChapter[];
+  chapter_summary: ApiChapterSummary;
+  chapter_window: ApiChapterWindow;
+};
+
+export interface ChapterWindowParams {
+  limit?: number;
+  order?: "asc" | "desc";
+  after?: string;
+  before?: string;
+  around?: string;
+}
+
 export interface ApiChapterDetail extends ApiChapter {
   manga_title: string;
   manga_slug: string;
@@ -83,6 +119,57 @@ export interface ApiChapterDetail extends ApiChapter {
   }[];
 }
 
+// Compact response shapes (requested with ?compact=1)
+interface CompactChapter {
+  id: string;
+  chapter_number: string;
+  title?: string | null;
+  page_count: number;
+  created_at: string;
+}
+
+interface CompactChapterDetail extends Omit<ApiChapterDetail, "pages"> {
+  image_base: string;
+  pages: {
+    id: string;
+    page_number: number;
+    image_key: string;
+  }[];
+}
+
+function expandChapter(mangaId: string, ch: CompactChapter): ApiChapter {
+  return {
+    id: ch.id,
+    manga_id: mangaId,
+    chapter_number: ch.chapter_number,
+    title: ch.title ?? null,
+    page_count: ch.page_count,
+    created_at: ch.created_at,
+  };
+}
+
+function expandChapterDetail(chapter: CompactChapterDetail): ApiChapterDetail {
+  return {
+    ...chapter,
+    pages: chapter.pages.map((page) => ({
+      id: page.id,
+      page_number: page.page_number,
+      image_key: page.image_key,
+      image_url: `${chapter.image_base}${page.image_key}`,
+    })),
+  };
+}
+
+function chapterWindowQuery(window: ChapterWindowParams): string {
+  const query = new URLSearchParams({ compact: "1" });
+  for (const [key, value] of Object.entries(window)) {
+    if (value !== undefined) {
+      query.set(key, String(value));
+    }
+  }
+  return query.toString();
+}
+
 // Fetch functions
 export async function getMangaList(): Promise<ApiManga[]> {
   try {
@@ -109,12 +196,14 @@ export async function getAllChapterParams(): Promise<
     const params: { slug: string; num: string }[] = [];
 
     for (const m of manga) {
-      const mangaData = await getMangaBySlug(m.slug);
-      if (mangaData?.chapters) {
-        for (const ch of mangaData.chapters) {
+      let after: string | undefined;
+      do {
+        const page = await getMangaChapters(m.id, { limit: 500, after });
+        for (const ch of page.chapters) {
           params.push({ slug: m.slug, num: ch.chapter_number });
         }
-      }
+        after = page.window.next_cursor ?? undefined;
+      } while (after);
     }
 
     return params;
@@ -148,11 +237,19 @@ export async function getLatestUpdates(): Promise<LatestMangaResponse["manga"]>
 }
 
 export async function getMangaBySlug(
-  slug: string
-): Promise<(ApiManga & { chapters: ApiChapter[] }) | null> {
+  slug: string,
+  window: ChapterWindowParams = {}
+): Promise<ApiMangaDetail | null> {
   try {
-    const data = await fetchApi<SingleMangaResponse>(`/manga/slug/${slug}`);
-    return data.manga;
+    const data = await fetchApi<SingleMangaResponse>(
+      `/manga/slug/${slug}?${chapterWindowQuery(window)}`
+    );
+    return {
+      ...data.manga,
+      chapters: data.manga.chapters.map((ch) =>
+        expandChapter(data.manga.id, ch)
+      ),
+    };
   } catch (error) {
     if (error instanceof ApiError && error.status === 404) {
       return null;
@@ -161,15 +258,28 @@ export async function getMangaBySlug(
   }
 }
 
+export async function getMangaChapters(
+  mangaId: string,
+  window: ChapterWindowParams = { limit: 100 }
+): Promise<{ chapters: ApiChapter[]; window: ApiChapterWindow }> {
+  const data = await fetchApi<ChaptersResponse>(
+    `/manga/${mangaId}/chapters?${chapterWindowQuery(window)}`
+  );
+  return {
+    chapters: data.chapters.map((ch) => expandChapter(mangaId, ch)),
+    window: data.chapter_window,
+  };
+}
+
 export async function getChapter(
   slug: string,
   chapterNumber: number
 ): Promise<ApiChapterDetail | null> {
   try {
     const data = await fetchApi<ChapterResponse>(
-      `/manga/slug/${slug}/chapter/${chapterNumber}`
+      `/manga/slug/${slug}/chapter/${chapterNumber}?compact=1`
     );
-    return data.chapter;
+    return expandChapterDetail(data.chapter);
   } catch (error) {
     if (error instanceof ApiError && error.status === 404) {
       return null;
@@ -1,5 +1,11 @@
+import base64
+import functools
+import gzip
+import hashlib
 import json
 import os
+import time
+from decimal import Decimal, InvalidOperation
 import boto3
 import psycopg2
 import psycopg2.extras
@@ -8,11 +14,28 @@ import logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 eventbridge_client = boto3.client('events')
 
 DATABASE_URL = os.environ['DATABASE_URL']
 CLOUDFRONT_DOMAIN = os.environ['CLOUDFRONT_DOMAIN']
 EVENTBRIDGE_BUS_NAME = os.environ.get('EVENTBRIDGE_BUS_NAME', '')
+COMPRESSION_MIN_BYTES = int(os.environ.get('COMPRESSION_MIN_BYTES', '1024'))
+CHAPTER_WINDOW_DEFAULT = 100
+CHAPTER_WINDOW_MAX = 500
+# chapters.chapter_number is DECIMAL(10, 2), so cursors must stay below 1e8
+CHAPTER_NUMBER_BOUND = Decimal('1e8')
+# Aggregate over a manga's chapters, shared by get_chapter_summary and the
+# LATERAL join in get_manga_by_slug (which saves the detail route a round trip)
+CHAPTER_SUMMARY_COLUMNS = """
+    COUNT(*) as count,
+    MIN(chapter_number) as first,
+    MAX(chapter_number) as latest
+"""
 
 def get_database_connection():
     """Get database connection using DATABASE_URL environment variable."""
@@ -41,6 +64,69 @@ def create_response(status_code, body, headers=None):
         'body': json.dumps(body, default=str)
     }
 
+def get_request_header(event, name):
+    """Get a request header value, ignoring header name case."""
+    for key, value in (event.get('headers') or {}).items():
+        if key.lower() == name:
+            return value
+    return None
+
+def negotiate_encoding(accept_encoding):
+    """Pick the best supported content encoding from an Accept-Encoding header."""
+    if not accept_encoding:
+        return None
+
+    accepted = {}
+    for part in accept_encoding.split(','):
+        coding, _, params = part.strip().partition(';')
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+
+    # Highest q wins; brotli (when the runtime has it) breaks ties over gzip
+    supported = ['br', 'gzip'] if brotli else ['gzip']
+    best, best_quality = None, 0.0
+    for coding in supported:
+        quality = accepted.get(coding, accepted.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+def compress_response(response, event):
+    """Compress a response body if the client accepts it and it is large enough."""
+    # Set Vary even on bodyless responses (e.g. 304) so caches key on encoding
+    response['headers']['Vary'] = 'Accept-Encoding'
+    body = response.get('body')
+    if not body or response.get('isBase64Encoded'):
+        return response
+
+    raw = body.encode('utf-8')
+    if len(raw) < COMPRESSION_MIN_BYTES:
+        return response
+
+    encoding = negotiate_encoding(get_request_header(event, 'accept-encoding'))
+    if encoding == 'br':
+        encoded = brotli.compress(raw, quality=5)
+    elif encoding == 'gzip':
+        encoded = gzip.compress(raw, compresslevel=6)
+    else:
+        return response
+
+    logger.debug(f"Compressed response with {encoding}: {len(raw)} -> {len(encoded)} bytes")
+    response['headers']['Content-Encoding'] = encoding
+    response['body'] = base64.b64encode(encoded).decode('ascii')
+    response['isBase64Encoded'] = True
+    return response
+
+def is_compact_request(query_params):
+    """Check whether the client asked for the compact response shape."""
+    return query_params.get('compact', '').lower() in ('1', 'true')
+
 def get_cloudfront_url(image_key):
     """Construct CloudFront URL for an image key."""
     if not image_key:
@@ -72,6 +158,34 @@ def emit_event(event_type, detail):
     except Exception as e:
         logger.error(f"Failed to emit event {event_type}: {str(e)}")
 
+def get_image_base():
+    """Get the CloudFront URL prefix shared by all image keys."""
+    return f"https://{CLOUDFRONT_DOMAIN}/"
+
+def compact_chapter_list(chapters):
+    """Strip fields a chapter list row repeats from its parent manga."""
+    compact = []
+    for chapter in chapters:
+        row = {
+            'id': chapter['id'],
+            'chapter_number': chapter['chapter_number'],
+            'page_count': chapter['page_count'],
+            'created_at': chapter['created_at'],
+        }
+        if chapter.get('title'):
+            row['title'] = chapter['title']
+        compact.append(row)
+    return compact
+
+def compact_chapter_detail(chapter):
+    """Replace per-page CloudFront URLs with a shared image_base and relative keys."""
+    chapter['image_base'] = get_image_base()
+    chapter['pages'] = [
+        {'id': page['id'], 'page_number': page['page_number'], 'image_key': page['image_key']}
+        for page in chapter['pages']
+    ]
+    return chapter
+
 def process_manga_cover(manga):
     """Generate CloudFront URL for manga cover if it's an S3 key."""
     if manga and manga.get('cover_image_url'):
@@ -148,25 +262,35 @@ def get_manga_slug_by_id(connection, manga_id):
     cursor.close()
     return result[0] if result else None
 
-def get_manga_by_slug(connection, slug):
-    """Get specific manga by slug with chapters."""
+def get_manga_by_slug(connection, slug, window=None):
+    """Get specific manga by slug with chapter summary and a window of chapters."""
     cursor = connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-    cursor.execute("""
-        SELECT id, title, slug, description, cover_image_url, status,
-               genres, author, artist, year, created_at, updated_at
-        FROM manga
-        WHERE slug = %s
+    cursor.execute(f"""
+        SELECT m.id, m.title, m.slug, m.description, m.cover_image_url, m.status,
+               m.genres, m.author, m.artist, m.year, m.created_at, m.updated_at,
+               s.count as chapter_count,
+               s.first as first_chapter,
+               s.latest as latest_chapter
+        FROM manga m
+        CROSS JOIN LATERAL (
+            SELECT {CHAPTER_SUMMARY_COLUMNS}
+            FROM chapters
+            WHERE manga_id = m.id
+        ) s
+        WHERE m.slug = %s
     """, (slug,))
     manga = cursor.fetchone()
-    if manga:
-        cursor.execute("""
-            SELECT id, manga_id, chapter_number, title, page_count, created_at
-            FROM chapters
-            WHERE manga_id = %s
-            ORDER BY chapter_number
-        """, (manga['id'],))
-        manga['chapters'] = cursor.fetchall()
     cursor.close()
+    if manga:
+        manga['chapter_summary'] = {
+            'count': manga.pop('chapter_count'),
+            'first': manga.pop('first_chapter'),
+            'latest': manga.pop('latest_chapter'),
+        }
+        if window is not None:
+            chapter_page = get_chapter_window(connection, manga['id'], **window)
+            manga['chapters'] = chapter_page['chapters']
+            manga['chapter_window'] = chapter_page['window']
     return manga
 
 def get_chapter_by_manga_and_number(connection, manga_slug, chapter_number):
@@ -232,6 +356,115 @@ def get_manga_chapters(connection, manga_id):
     cursor.close()
     return chapters
 
+def parse_chapter_window_params(query_params, default_limit=CHAPTER_WINDOW_DEFAULT):
+    """Parse chapter window query parameters, returning None if any are invalid."""
+    order = query_params.get('order', 'asc').lower()
+    if order not in ('asc', 'desc'):
+        return None
+
+    try:
+        limit = int(query_params.get('limit', default_limit))
+        bounds = {
+            key: Decimal(query_params[key])
+            for key in ('after', 'before', 'around')
+            if query_params.get(key)
+        }
+    except (ValueError, InvalidOperation):
+        return None
+
+    if limit < 1 or len(bounds) > 1:
+        return None
+    if any(not b.is_finite() or abs(b) >= CHAPTER_NUMBER_BOUND for b in bounds.values()):
+        return None
+
+    return {'limit': min(limit, CHAPTER_WINDOW_MAX), 'order': order, **bounds}
+
+def has_chapter_window_params(query_params):
+    """Check whether any chapter window query parameter was supplied."""
+    return any(key in query_params for key in ('limit', 'order', 'after', 'before', 'around'))
+
+def get_chapter_summary(connection, manga_id):
+    """Get chapter count and first/latest chapter numbers for a manga."""
+    cursor = connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+    cursor.execute(f"""
+        SELECT {CHAPTER_SUMMARY_COLUMNS}
+        FROM chapters
+        WHERE manga_id = %s
+    """, (manga_id,))
+    summary = cursor.fetchone()
+    cursor.close()
+    return summary
+
+def select_chapter_rows(cursor, manga_id, direction, limit, comparison=None, bound=None):
+    """Select chapter rows ordered by chapter_number, optionally bounded by a keyset condition."""
+    condition = f"AND chapter_number {comparison} %s" if comparison else ""
+    params = (manga_id, bound, limit) if comparison else (manga_id, limit)
+    cursor.execute(f"""
+        SELECT id, manga_id, chapter_number, title, page_count, created_at
+        FROM chapters
+        WHERE manga_id = %s {condition}
+        ORDER BY chapter_number {direction}
+        LIMIT %s
+    """, params)
+    return cursor.fetchall()
+
+def chapter_exists(cursor, manga_id, comparison, bound):
+    """Check whether any chapter lies on the given side of a chapter number."""
+    cursor.execute(f"""
+        SELECT EXISTS (
+            SELECT 1 FROM chapters
+            WHERE manga_id = %s AND chapter_number {comparison} %s
+        ) as found
+    """, (manga_id, bound))
+    return cursor.fetchone()['found']
+
+def get_chapter_window(connection, manga_id, limit=CHAPTER_WINDOW_DEFAULT, order='asc',
+                       after=None, before=None, around=None):
+    """Get a window of chapters using keyset pagination on chapter_number.
+
+    `after` and `before` are exclusive cursors in the requested order; `around`
+    centers the window on a chapter number. Cursors for the neighbouring
+    windows are returned alongside the chapters.
+    """
+    forward, backward = ('ASC', 'DESC') if order == 'asc' else ('DESC', 'ASC')
+    past, behind, at_or_past = ('>', '<', '>=') if order == 'asc' else ('<', '>', '<=')
+
+    cursor = connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+    if around is not None:
+        behind_rows = select_chapter_rows(cursor, manga_id, backward, limit + 1, behind, around)
+        ahead_rows = select_chapter_rows(cursor, manga_id, forward, limit + 1, at_or_past, around)
+        # Centre on the target, but fill from the other side near either end
+        take_behind = min(len(behind_rows), max(limit // 2, limit - len(ahead_rows)))
+        take_ahead = min(len(ahead_rows), limit - take_behind)
+        chapters = behind_rows[:take_behind][::-1] + ahead_rows[:take_ahead]
+        has_prev = len(behind_rows) > take_behind
+        has_next = len(ahead_rows) > take_ahead
+    elif before is not None:
+        rows = select_chapter_rows(cursor, manga_id, backward, limit + 1, behind, before)
+        chapters = rows[:limit][::-1]
+        has_prev = len(rows) > limit
+        has_next = bool(chapters) and chapter_exists(cursor, manga_id, past, chapters[-1]['chapter_number'])
+    else:
+        if after is not None:
+            rows = select_chapter_rows(cursor, manga_id, forward, limit + 1, past, after)
+        else:
+            rows = select_chapter_rows(cursor, manga_id, forward, limit + 1)
+        chapters = rows[:limit]
+        has_prev = (after is not None and bool(chapters)
+                    and chapter_exists(cursor, manga_id, behind, chapters[0]['chapter_number']))
+        has_next = len(rows) > limit
+    cursor.close()
+
+    return {
+        'chapters': chapters,
+        'window': {
+            'order': order,
+            'limit': limit,
+            'prev_cursor': chapters[0]['chapter_number'] if has_prev and chapters else None,
+            'next_cursor': chapters[-1]['chapter_number'] if has_next and chapters else None,
+        }
+    }
+
 def get_chapter_details(connection, chapter_id):
     """Get chapter details with page URLs."""
     cursor = connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
@@ -306,144 +539,344 @@ def create_chapter(connection, chapter_data):
     cursor.close()
     return chapter
 
+class Request:
+    """API Gateway request with a database connection opened on first use."""
+
+    def __init__(self, event, method, path, path_params):
+        self.event = event
+        self.method = method
+        self.path = path
+        self.path_params = path_params
+        self.query_params = event.get('queryStringParameters') or {}
+        self._connection = None
+
+    @property
+    def connection(self):
+        if self._connection is None:
+            self._connection = get_database_connection()
+        return self._connection
+
+    def json_body(self):
+        """Parse the request body as JSON."""
+        body = self.event.get('body') or '{}'
+        if isinstance(body, str):
+            body = json.loads(body)
+        return body
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+# Middleware
+
+def timing_middleware(request, call_next):
+    """Log handler duration and status for each request."""
+    start = time.perf_counter()
+    response = call_next(request)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.info(f"{request.method} {request.path} -> {response['statusCode']} in {elapsed_ms:.1f}ms")
+    return response
+
+def compression_middleware(request, call_next):
+    """Compress the response body according to Accept-Encoding."""
+    return compress_response(call_next(request), request.event)
+
+def etag_matches(if_none_match, etag):
+    """Check an If-None-Match header against an ETag using weak comparison."""
+    if not if_none_match:
+        return False
+    opaque_tag = etag.removeprefix('W/')
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*' or candidate.removeprefix('W/') == opaque_tag:
+            return True
+    return False
+
+def etag_middleware(request, call_next):
+    """Add an ETag to successful responses and answer matching If-None-Match with 304.
+
+    The tag is weak because it is computed before compression, so the
+    identity, gzip and br encodings of a body all share it.
+    """
+    response = call_next(request)
+    if response['statusCode'] != 200 or response.get('isBase64Encoded'):
+        return response
+
+    etag = 'W/"' + hashlib.md5(response['body'].encode('utf-8')).hexdigest() + '"'
+    response['headers']['ETag'] = etag
+    if etag_matches(get_request_header(request.event, 'if-none-match'), etag):
+        response['statusCode'] = 304
+        response['body'] = ''
+    return response
+
+def cache_control_middleware(max_age):
+    """Build middleware that sets Cache-Control on successful responses."""
+    def middleware(request, call_next):
+        response = call_next(request)
+        if response['statusCode'] in (200, 304):
+            response['headers']['Cache-Control'] = f'public, max-age={max_age}'
+        return response
+    return middleware
+
+# Route handlers
+
+def handle_list_manga(request):
+    """GET /manga - List all manga (with optional ?popular=true)."""
+    popular = request.query_params.get('popular', '').lower() == 'true'
+    manga_list = get_manga_list(request.connection, popular=popular)
+    process_manga_list_covers(manga_list)
+    return create_response(200, {'manga': manga_list})
+
+def handle_latest_manga(request):
+    """GET /manga/latest - Get manga sorted by most recent chapter."""
+    manga_list = get_latest_manga(request.connection)
+    process_manga_list_covers(manga_list)
+    return create_response(200, {'manga': manga_list})
+
+def handle_manga_by_slug(request):
+    """GET /manga/slug/{slug} - Get manga by slug with the first chapter window.
+
+    ?summary=only skips the chapter list.
+    """
+    slug = request.path_params.get('slug')
+    if not slug:
+        return create_response(400, {'error': 'Missing slug'})
+    window = None
+    if request.query_params.get('summary', '').lower() != 'only':
+        window = parse_chapter_window_params(request.query_params)
+        if window is None:
+            return create_response(400, {'error': 'Invalid chapter window parameters'})
+    manga = get_manga_by_slug(request.connection, slug, window)
+    if not manga:
+        return create_response(404, {'error': 'Manga not found'})
+    process_manga_cover(manga)
+    if window is not None and is_compact_request(request.query_params):
+        manga['chapters'] = compact_chapter_list(manga['chapters'])
+    return create_response(200, {'manga': manga})
+
+def handle_chapter_by_slug(request):
+    """GET /manga/slug/{slug}/chapter/{num} - Get chapter by slug and number."""
+    slug = request.path_params.get('slug')
+    chapter_num = request.path_params.get('num')
+    if not slug or not chapter_num:
+        return create_response(400, {'error': 'Missing slug or chapter number'})
+    chapter = get_chapter_by_manga_and_number(request.connection, slug, float(chapter_num))
+    if not chapter:
+        return create_response(404, {'error': 'Chapter not found'})
+    if is_compact_request(request.query_params):
+        compact_chapter_detail(chapter)
+    return create_response(200, {'chapter': chapter})
+
+def handle_manga_chapters(request):
+    """GET /manga/{id}/chapters - List chapters for manga.
+
+    Windowed when limit/order/after/before/around is given.
+    """
+    manga_id = request.path_params.get('id')
+    if not manga_id:
+        return create_response(400, {'error': 'Missing manga ID'})
+
+    summary_param = request.query_params.get('summary', '').lower()
+    response_body = {}
+    if summary_param in ('only', 'true', '1'):
+        response_body['chapter_summary'] = get_chapter_summary(request.connection, manga_id)
+    if summary_param == 'only':
+        return create_response(200, response_body)
+
+    if has_chapter_window_params(request.query_params):
+        window = parse_chapter_window_params(request.query_params)
+        if window is None:
+            return create_response(400, {'error': 'Invalid chapter window parameters'})
+        chapter_page = get_chapter_window(request.connection, manga_id, **window)
+        chapters = chapter_page['chapters']
+        response_body['chapter_window'] = chapter_page['window']
+    else:
+        chapters = get_manga_chapters(request.connection, manga_id)
+
+    if is_compact_request(request.query_params):
+        chapters = compact_chapter_list(chapters)
+    response_body['chapters'] = chapters
+    return create_response(200, response_body)
+
+def handle_manga_by_id(request):
+    """GET /manga/{id} - Get specific manga."""
+    manga_id = request.path_params.get('id')
+    if not manga_id:
+        return create_response(400, {'error': 'Missing manga ID'})
+
+    manga = get_manga_by_id(request.connection, manga_id)
+    if not manga:
+        return create_response(404, {'error': 'Manga not found'})
+
+    process_manga_cover(manga)
+    return create_response(200, {'manga': manga})
+
+def handle_chapter_by_id(request):
+    """GET /chapters/{id} - Get chapter details."""
+    chapter_id = request.path_params.get('id')
+    if not chapter_id:
+        return create_response(400, {'error': 'Missing chapter ID'})
+
+    chapter = get_chapter_details(request.connection, chapter_id)
+    if not chapter:
+        return create_response(404, {'error': 'Chapter not found'})
+
+    if is_compact_request(request.query_params):
+        compact_chapter_detail(chapter)
+    return create_response(200, {'chapter': chapter})
+
+def handle_create_manga(request):
+    """POST /manga - Create new manga."""
+    body = request.json_body()
+    required_fields = ['title', 'slug']
+    if not all(field in body for field in required_fields):
+        return create_response(400, {'error': 'Missing required fields: title, slug'})
+
+    manga = create_manga(request.connection, body)
+
+    # Emit event for cache invalidation
+    emit_event('manga.created', {
+        'manga_id': str(manga['id']),
+        'manga_slug': manga['slug']
+    })
+
+    return create_response(201, {'manga': manga})
+
+def handle_create_chapter(request):
+    """POST /chapters - Create new chapter."""
+    body = request.json_body()
+    required_fields = ['manga_id', 'chapter_number', 'page_count']
+    if not all(field in body for field in required_fields):
+        return create_response(400, {'error': 'Missing required fields: manga_id, chapter_number, page_count'})
+
+    chapter = create_chapter(request.connection, body)
+
+    # Get manga slug for event
+    manga_slug = get_manga_slug_by_id(request.connection, body['manga_id'])
+
+    # Emit event for cache invalidation
+    emit_event('chapter.created', {
+        'manga_id': str(body['manga_id']),
+        'manga_slug': manga_slug,
+        'chapter_number': float(chapter['chapter_number'])
+    })
+
+    return create_response(201, {'chapter': chapter})
+
+def handle_preflight(request):
+    """OPTIONS * - Answer CORS preflight without touching the database."""
+    response = create_response(204, {}, {'Access-Control-Max-Age': '300'})
+    # No body, so no Content-Type either
+    del response['headers']['Content-Type']
+    response['body'] = ''
+    return response
+
+# Route table
+
+DEFAULT_MIDDLEWARE = [timing_middleware, compression_middleware]
+
+# (method, pattern, handler, per-route middleware). Middleware runs
+# outermost first, after DEFAULT_MIDDLEWARE. Chapter routes deliberately
+# skip cache_control_middleware: next_chapter changes when a chapter is
+# added, and browser caches cannot be purged.
+ROUTES = [
+    ('GET', '/manga', handle_list_manga, [etag_middleware]),
+    ('GET', '/manga/latest', handle_latest_manga, [etag_middleware]),
+    ('GET', '/manga/slug/{slug}', handle_manga_by_slug, [etag_middleware]),
+    ('GET', '/manga/slug/{slug}/chapter/{num}', handle_chapter_by_slug, [etag_middleware]),
+    ('GET', '/manga/{id}/chapters', handle_manga_chapters, [etag_middleware]),
+    ('GET', '/manga/{id}', handle_manga_by_id, [etag_middleware]),
+    ('GET', '/chapters/{id}', handle_chapter_by_id, [etag_middleware]),
+    ('POST', '/manga', handle_create_manga, []),
+    ('POST', '/chapters', handle_create_chapter, []),
+]
+
+def build_pipeline(handler, middleware):
+    """Wrap a handler so each middleware receives the next stage as call_next."""
+    call = handler
+    for mw in reversed(middleware):
+        call = functools.partial(mw, call_next=call)
+    return call
+
+def build_router(routes):
+    """Compile routes into a route-key lookup table and a path segment trie."""
+    by_route_key = {}
+    trie = {'static': {}, 'param': None, 'methods': {}}
+    for method, pattern, handler, middleware in routes:
+        pipeline = build_pipeline(handler, DEFAULT_MIDDLEWARE + middleware)
+        by_route_key[f'{method} {pattern}'] = pipeline
+
+        node = trie
+        param_names = []
+        for segment in pattern.strip('/').split('/'):
+            if segment.startswith('{') and segment.endswith('}'):
+                param_names.append(segment[1:-1])
+                if node['param'] is None:
+                    node['param'] = {'static': {}, 'param': None, 'methods': {}}
+                node = node['param']
+            else:
+                node = node['static'].setdefault(segment, {'static': {}, 'param': None, 'methods': {}})
+        node['methods'][method] = (pipeline, param_names)
+    return by_route_key, trie
+
+def match_path(node, segments, index, method, values):
+    """Walk the trie, preferring static segments over parameters."""
+    if index == len(segments):
+        return node['methods'].get(method), values
+
+    static_child = node['static'].get(segments[index])
+    if static_child is not None:
+        match, matched_values = match_path(static_child, segments, index + 1, method, values)
+        if match is not None:
+            return match, matched_values
+
+    if node['param'] is not None:
+        return match_path(node['param'], segments, index + 1, method, values + [segments[index]])
+
+    return None, values
+
+ROUTES_BY_KEY, ROUTE_TRIE = build_router(ROUTES)
+PREFLIGHT_PIPELINE = build_pipeline(handle_preflight, [])
+
+def resolve_route(method, path, route_key=None):
+    """Find the pipeline and path parameters for a request, or (None, {})."""
+    if method == 'OPTIONS':
+        return PREFLIGHT_PIPELINE, {}
+
+    # API Gateway hands us the matched route key, so this is one dict lookup
+    pipeline = ROUTES_BY_KEY.get(route_key)
+    if pipeline is not None:
+        return pipeline, {}
+
+    segments = path.strip('/').split('/')
+    match, values = match_path(ROUTE_TRIE, segments, 0, method, [])
+    if match is None:
+        return None, {}
+    pipeline, param_names = match
+    return pipeline, dict(zip(param_names, values))
+
 def lambda_handler(event, context):
     """Main Lambda handler function."""
+    request = None
     try:
-        logger.info(f"Event: {json.dumps(event)}")
-
-        http_method = event.get('requestContext', {}).get('http', {}).get('method')
-        raw_path = event.get('requestContext', {}).get('http', {}).get('path', '')
+        http = event.get('requestContext', {}).get('http', {})
+        http_method = http.get('method')
+        raw_path = http.get('path', '')
         # Strip stage prefix from path (e.g., /manga-reader/manga -> /manga)
         stage = event.get('requestContext', {}).get('stage', '')
         path = raw_path[len(f'/{stage}'):] if stage and raw_path.startswith(f'/{stage}') else raw_path
-        path_parameters = event.get('pathParameters') or {}
-
-        # Get database connection
-        connection = get_database_connection()
-
-        try:
-            # Get query parameters
-            query_params = event.get('queryStringParameters') or {}
-
-            # Route handling
-            if http_method == 'GET':
-                if path == '/manga':
-                    # GET /manga - List all manga (with optional ?popular=true)
-                    popular = query_params.get('popular', '').lower() == 'true'
-                    manga_list = get_manga_list(connection, popular=popular)
-                    process_manga_list_covers(manga_list)
-                    return create_response(200, {'manga': manga_list})
-
-                elif path == '/manga/latest':
-                    # GET /manga/latest - Get manga sorted by most recent chapter
-                    manga_list = get_latest_manga(connection)
-                    process_manga_list_covers(manga_list)
-                    return create_response(200, {'manga': manga_list})
-
-                elif path.startswith('/manga/slug/'):
-                    # Slug-based routes
-                    if '/chapter/' in path:
-                        # GET /manga/slug/{slug}/chapter/{num} - Get chapter by slug and number
-                        slug = path_parameters.get('slug')
-                        chapter_num = path_parameters.get('num')
-                        if not slug or not chapter_num:
-                            return create_response(400, {'error': 'Missing slug or chapter number'})
-                        chapter = get_chapter_by_manga_and_number(connection, slug, float(chapter_num))
-                        if not chapter:
-                            return create_response(404, {'error': 'Chapter not found'})
-                        return create_response(200, {'chapter': chapter})
-                    else:
-                        # GET /manga/slug/{slug} - Get manga by slug
-                        slug = path_parameters.get('slug')
-                        if not slug:
-                            return create_response(400, {'error': 'Missing slug'})
-                        manga = get_manga_by_slug(connection, slug)
-                        if not manga:
-                            return create_response(404, {'error': 'Manga not found'})
-                        process_manga_cover(manga)
-                        return create_response(200, {'manga': manga})
-
-                elif path.startswith('/manga/') and path.endswith('/chapters'):
-                    # GET /manga/{id}/chapters - List chapters for manga
-                    manga_id = path_parameters.get('id')
-                    if not manga_id:
-                        return create_response(400, {'error': 'Missing manga ID'})
-
-                    chapters = get_manga_chapters(connection, manga_id)
-                    return create_response(200, {'chapters': chapters})
-
-                elif path.startswith('/manga/'):
-                    # GET /manga/{id} - Get specific manga
-                    manga_id = path_parameters.get('id')
-                    if not manga_id:
-                        return create_response(400, {'error': 'Missing manga ID'})
-
-                    manga = get_manga_by_id(connection, manga_id)
-                    if not manga:
-                        return create_response(404, {'error': 'Manga not found'})
-
-                    process_manga_cover(manga)
-                    return create_response(200, {'manga': manga})
-
-                elif path.startswith('/chapters/'):
-                    # GET /chapters/{id} - Get chapter details
-                    chapter_id = path_parameters.get('id')
-                    if not chapter_id:
-                        return create_response(400, {'error': 'Missing chapter ID'})
-
-                    chapter = get_chapter_details(connection, chapter_id)
-                    if not chapter:
-                        return create_response(404, {'error': 'Chapter not found'})
-
-                    return create_response(200, {'chapter': chapter})
-
-            elif http_method == 'POST':
-                # Parse request body
-                body = event.get('body', '{}')
-                if isinstance(body, str):
-                    body = json.loads(body)
-
-                if path == '/manga':
-                    # POST /manga - Create new manga
-                    required_fields = ['title', 'slug']
-                    if not all(field in body for field in required_fields):
-                        return create_response(400, {'error': 'Missing required fields: title, slug'})
-
-                    manga = create_manga(connection, body)
-
-                    # Emit event for cache invalidation
-                    emit_event('manga.created', {
-                        'manga_id': str(manga['id']),
-                        'manga_slug': manga['slug']
-                    })
-
-                    return create_response(201, {'manga': manga})
-
-                elif path == '/chapters':
-                    # POST /chapters - Create new chapter
-                    required_fields = ['manga_id', 'chapter_number', 'page_count']
-                    if not all(field in body for field in required_fields):
-                        return create_response(400, {'error': 'Missing required fields: manga_id, chapter_number, page_count'})
-
-                    chapter = create_chapter(connection, body)
-
-                    # Get manga slug for event
-                    manga_slug = get_manga_slug_by_id(connection, body['manga_id'])
-
-                    # Emit event for cache invalidation
-                    emit_event('chapter.created', {
-                        'manga_id': str(body['manga_id']),
-                        'manga_slug': manga_slug,
-                        'chapter_number': float(chapter['chapter_number'])
-                    })
-
-                    return create_response(201, {'chapter': chapter})
-
-            # Route not found
+        logger.debug(f"Event: {json.dumps(event)}")
+
+        # Routed requests are logged by timing_middleware
+        pipeline, path_parameters = resolve_route(http_method, path, event.get('routeKey'))
+        if pipeline is None:
+            logger.info(f"Route not found: {http_method} {path}")
             return create_response(404, {'error': 'Route not found'})
 
-        finally:
-            connection.close()
+        path_parameters.update(event.get('pathParameters') or {})
+        request = Request(event, http_method, path, path_parameters)
+        return pipeline(request)
 
     except psycopg2.Error as e:
         logger.error(f"Database error: {str(e)}")
@@ -456,3 +889,7 @@ def lambda_handler(event, context):
     except Exception as e:
         logger.error(f"Unexpected error: {str(e)}")
         return create_response(500, {'error': 'Internal server error'})
+
+    finally:
+        if request is not None:
+            request.close()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import sys
+import timeit
+
+# The handler module reads these at import time; dispatch never uses them
+os.environ.setdefault('DATABASE_URL', 'postgresql://bench@localhost/bench')
+os.environ.setdefault('CLOUDFRONT_DOMAIN', 'bench.cloudfront.net')
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambda'))
+
+import lambda_function
+
+CASES = [
+    ('GET', '/manga', 'GET /manga'),
+    ('GET', '/manga/latest', 'GET /manga/latest'),
+    ('GET', '/manga/slug/one-piece', 'GET /manga/slug/{slug}'),
+    ('GET', '/manga/slug/one-piece/chapter/1100', 'GET /manga/slug/{slug}/chapter/{num}'),
+    ('GET', '/manga/0b7c/chapters', 'GET /manga/{id}/chapters'),
+    ('GET', '/chapters/0b7c', 'GET /chapters/{id}'),
+    ('POST', '/chapters', 'POST /chapters'),
+    ('GET', '/does/not/exist', None),
+]
+
+def make_event(method, path, route_key=None):
+    """Build a minimal API Gateway HTTP API (v2) event."""
+    event = {'requestContext': {'http': {'method': method, 'path': path}}}
+    if route_key:
+        event['routeKey'] = route_key
+    return event
+
+def bench(label, func, number):
+    """Time func and print the mean cost per call."""
+    seconds = min(timeit.repeat(func, number=number, repeat=5))
+    print(f"{label:<55} {seconds / number * 1e9:>10.0f} ns/op")
+
+def main():
+    parser = argparse.ArgumentParser(description='Microbenchmark Lambda route dispatch')
+    parser.add_argument('--number', type=int, default=100000, help='Calls per timing run')
+    args = parser.parse_args()
+
+    # Keep per-request logging out of the measurements
+    lambda_function.logger.disabled = True
+
+    print("resolve_route via routeKey lookup")
+    for method, path, route_key in CASES:
+        if route_key:
+            bench(f"  {route_key}", lambda: lambda_function.resolve_route(method, path, route_key), args.number)
+
+    print("resolve_route via path trie")
+    for method, path, _ in CASES:
+        bench(f"  {method} {path}", lambda: lambda_function.resolve_route(method, path), args.number)
+
+    print("lambda_handler without a database")
+    for label, event in [
+        ('  OPTIONS preflight', make_event('OPTIONS', '/manga/slug/one-piece')),
+        ('  404 route not found', make_event('GET', '/does/not/exist')),
+    ]:
+        bench(label, lambda: lambda_function.lambda_handler(event, None), args.number // 10)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+import argparse
+import datetime
+import gzip
+import json
+import os
+import sys
+import timeit
+import uuid
+from decimal import Decimal
+
+# The handler module reads these at import time; the payload helpers never use them
+os.environ.setdefault('DATABASE_URL', 'postgresql://bench@localhost/bench')
+os.environ.setdefault('CLOUDFRONT_DOMAIN', 'd1a2b3c4d5e6f7.cloudfront.net')
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambda'))
+
+import lambda_function
+
+def make_chapters(manga_id, count):
+    """Build chapter list rows shaped like get_manga_chapters output."""
+    start = datetime.datetime(2020, 1, 1, 12, 0, 0)
+    return [
+        {
+            'id': str(uuid.uuid4()),
+            'manga_id': manga_id,
+            'chapter_number': Decimal(f'{number}.00'),
+            'title': f'Chapter title {number}' if number % 3 == 0 else None,
+            'page_count': 20,
+            'created_at': start + datetime.timedelta(days=number, microseconds=number * 7919),
+        }
+        for number in range(1, count + 1)
+    ]
+
+def make_chapter_detail(manga_id, slug, page_count):
+    """Build a chapter row shaped like get_chapter_by_manga_and_number output."""
+    chapter = make_chapters(manga_id, 1)[0]
+    chapter.update({'manga_title': 'Bench Manga', 'manga_slug': slug,
+                    'prev_chapter': None, 'next_chapter': 2.0})
+    chapter['pages'] = []
+    for number in range(1, page_count + 1):
+        image_key = f'{slug}/chapter-1/page-{number:03d}.jpg'
+        chapter['pages'].append({
+            'id': str(uuid.uuid4()),
+            'page_number': number,
+            'image_key': image_key,
+            'image_url': lambda_function.get_cloudfront_url(image_key),
+        })
+    return chapter
+
+def encoders():
+    """Content encodings the handler can produce in this environment."""
+    available = [('identity', lambda raw: raw), ('gzip', lambda raw: gzip.compress(raw, compresslevel=6))]
+    if lambda_function.brotli:
+        available.append(('br', lambda raw: lambda_function.brotli.compress(raw, quality=5)))
+    return available
+
+def report(label, body, mbps, number):
+    """Print encoded size, encode time and estimated transfer time per encoding."""
+    raw = json.dumps(body, default=str).encode('utf-8')
+    for encoding, encode in encoders():
+        encoded = encode(raw)
+        encode_ms = min(timeit.repeat(lambda: encode(raw), number=number, repeat=3)) / number * 1000
+        transfer_ms = len(encoded) * 8 / (mbps * 1e6) * 1000
+        print(f"  {label:<10} {encoding:<9} {len(encoded):>10} bytes {encode_ms:>8.2f} ms encode {transfer_ms:>8.1f} ms transfer")
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare full vs compact and raw vs compressed response sizes')
+    parser.add_argument('--chapters', type=int, default=1000, help='Chapters in the synthetic series')
+    parser.add_argument('--pages', type=int, default=40, help='Pages in the synthetic chapter')
+    parser.add_argument('--mbps', type=float, default=10.0, help='Link speed for the transfer estimate')
+    parser.add_argument('--number', type=int, default=20, help='Calls per encode timing run')
+    args = parser.parse_args()
+
+    manga_id = str(uuid.uuid4())
+    slug = 'bench-manga'
+    if not lambda_function.brotli:
+        print("brotli not installed, reporting identity and gzip only")
+
+    chapters = make_chapters(manga_id, args.chapters)
+    print(f"Chapter list ({args.chapters} chapters)")
+    report('full', {'chapters': chapters}, args.mbps, args.number)
+    report('compact', {'chapters': lambda_function.compact_chapter_list(chapters)}, args.mbps, args.number)
+
+    chapter = make_chapter_detail(manga_id, slug, args.pages)
+    print(f"Chapter detail ({args.pages} pages)")
+    report('full', {'chapter': chapter}, args.mbps, args.number)
+    report('compact', {'chapter': lambda_function.compact_chapter_detail(chapter)}, args.mbps, args.number)
+
+if __name__ == "__main__":
+    main()
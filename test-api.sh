@@ -74,6 +74,34 @@ test_endpoint() {
     echo ""
 }
 
+test_compression() {
+    local endpoint="$1"
+
+    print_test "GET $endpoint (Accept-Encoding: gzip)"
+
+    local headers
+    headers=$(curl -s -o /dev/null -D - -H "Accept-Encoding: gzip" "$API_ENDPOINT$endpoint" | tr -d '\r')
+
+    if ! echo "$headers" | grep -qi "^vary: .*accept-encoding"; then
+        print_error "Missing Vary: Accept-Encoding"
+        echo "$headers"
+        return 1
+    fi
+
+    if echo "$headers" | grep -qi "^content-encoding: gzip"; then
+        # Body must decode back to valid JSON
+        if ! curl -s --compressed "$API_ENDPOINT$endpoint" | jq . >/dev/null; then
+            print_error "Compressed body did not decode to JSON"
+            return 1
+        fi
+        print_success "Response gzip-encoded"
+    else
+        print_success "Response below compression threshold, sent uncompressed"
+    fi
+
+    echo ""
+}
+
 create_sample_manga() {
     print_test "Creating sample manga"
 
@@ -144,6 +172,7 @@ run_tests() {
 
     # Test basic endpoints
     test_endpoint "GET" "/manga" "" "200"
+    test_compression "/manga"
 
     # Create sample data and get IDs
     ids=$(create_sample_manga)
@@ -153,9 +182,16 @@ run_tests() {
     if [ -n "$manga_id" ]; then
         test_endpoint "GET" "/manga/$manga_id" "" "200"
         test_endpoint "GET" "/manga/$manga_id/chapters" "" "200"
+        test_endpoint "GET" "/manga/$manga_id/chapters?limit=1&order=desc" "" "200"
+        test_endpoint "GET" "/manga/$manga_id/chapters?around=1&limit=10" "" "200"
+        test_endpoint "GET" "/manga/$manga_id/chapters?summary=only" "" "200"
+        test_endpoint "GET" "/manga/$manga_id/chapters?after=abc" "" "400"
+        test_endpoint "GET" "/manga/$manga_id/chapters?compact=1" "" "200"
+        test_compression "/manga/$manga_id/chapters"
 
         if [ -n "$chapter_id" ]; then
             test_endpoint "GET" "/chapters/$chapter_id" "" "200"
+            test_endpoint "GET" "/chapters/$chapter_id?compact=1" "" "200"
         fi
     fi
 